@@ -1,5 +1,4 @@
-from functools import lru_cache
-
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,7 +6,12 @@ class Settings(BaseSettings):
     """Application settings."""
 
     # Security Settings
-    allowed_origins: list[str] = ["*"]
+    allowed_origins: tuple[str, ...] = ("*",)
+
+    # Server Settings
+    workers: int | None = Field(
+        None, ge=1, description="Worker processes, defaults to the usable CPU count"
+    )
 
     # Logging Settings
     log_level: str = "INFO"
@@ -20,7 +24,9 @@ class Settings(BaseSettings):
     )
 
 
-@lru_cache()
+_settings = Settings()
+
+
 def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+    """Get the application-wide settings instance."""
+    return _settings
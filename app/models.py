@@ -1,11 +1,17 @@
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# Shared config for response-side models, which only carry upstream data
+# back out and are never mutated after construction
+RESPONSE_MODEL_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class MCPServerInfo(BaseModel):
     """Basic MCP server information."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     name: str = Field(..., description="Server name")
     id: str = Field(..., description="Server ID in format @group/name")
     description: str = Field(..., description="Server description")
@@ -14,6 +20,8 @@ class MCPServerInfo(BaseModel):
 class MCPServerEndpoint(BaseModel):
     """MCP server endpoint configuration."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     type: Literal["sse", "streamable_http"] = Field(..., description="Endpoint type")
     url: str = Field(..., description="Endpoint URL")
 
@@ -29,6 +37,8 @@ class MCPServerDetail(MCPServerInfo):
 class OperationalMCPServer(BaseModel):
     """Operational MCP server with active endpoints."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     name: str = Field(..., description="Server name")
     id: str = Field(..., description="Server ID")
     description: str = Field(..., description="Server description")
@@ -52,13 +62,6 @@ class ListServersRequest(BaseModel):
         "map", description="Search keyword for server name or owner"
     )
 
-    @field_validator("total_count")
-    @classmethod
-    def validate_total_count(cls, v):
-        if v is not None and (v < 1 or v > 100):
-            raise ValueError("total_count must be between 1 and 100")
-        return v
-
 
 class GetServerRequest(BaseModel):
     """Request model for getting a specific MCP server."""
@@ -68,6 +71,12 @@ class GetServerRequest(BaseModel):
         description="Server ID in format @group/name or group/name",
     )
 
+    @field_validator("server_id")
+    @classmethod
+    def normalize_server_id(cls, v: str) -> str:
+        """Ensure server_id has the @ prefix."""
+        return v if v.startswith("@") else "@" + v
+
 
 class ListOperationalServersRequest(BaseModel):
     """Request model for listing operational MCP servers."""
@@ -78,6 +87,8 @@ class ListOperationalServersRequest(BaseModel):
 class ListServersResponse(BaseModel):
     """Response model for listing MCP servers."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     total_count: int = Field(..., description="Total number of servers found")
     servers: List[MCPServerInfo] = Field(..., description="List of MCP servers")
 
@@ -85,6 +96,8 @@ class ListServersResponse(BaseModel):
 class ListOperationalServersResponse(BaseModel):
     """Response model for listing operational MCP servers."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     total_count: int = Field(..., description="Total number of operational servers")
     servers: List[OperationalMCPServer] = Field(
         ..., description="List of operational servers with endpoints"
@@ -100,5 +113,7 @@ class GetServerResponse(MCPServerDetail):
 class HealthResponse(BaseModel):
     """Health check response."""
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: str = Field(..., description="Service status")
     message: str = Field(..., description="Status message")
@@ -1,12 +1,9 @@
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from fastapi import APIRouter, Header, HTTPException, status
+from fastapi import APIRouter, Header, Response
+from pydantic import BaseModel
 
-from app.exceptions import (
-    AuthenticationError,
-    MCPAPIException,
-    ServerNotFoundError,
-)
 from app.models import (
     GetServerRequest,
     GetServerResponse,
@@ -19,11 +16,28 @@ from app.service import MCPService
 router = APIRouter(prefix="/api/v1", tags=["MCP Servers"])
 
 
+@lru_cache(maxsize=128)
 def get_service(token: Optional[str] = None) -> MCPService:
-    """Get MCP service instance with optional token."""
+    """Get cached MCP service instance for the given optional token.
+
+    Caching per token lets repeat callers reuse an already logged-in client
+    instead of authenticating with ModelScope on every request.
+    """
     return MCPService(token=token)
 
 
+def _json_response(model: type[BaseModel], data: Dict[str, Any]) -> Response:
+    """Validate upstream data against a response model and encode it in one pass.
+
+    Returning a Response skips FastAPI's own response_model validation and
+    JSON rendering, while the route's response_model still documents the schema.
+    """
+    return Response(
+        content=model.model_validate(data).model_dump_json(),
+        media_type="application/json",
+    )
+
+
 @router.post(
     "/servers/list",
     response_model=ListServersResponse,
@@ -51,35 +65,15 @@ async def list_servers(
     x_modelscope_token: Optional[str] = Header(
         None, description="ModelScope API token"
     ),
-) -> ListServersResponse:
+) -> Response:
     """List MCP servers with filtering and search capabilities."""
-    try:
-        service = get_service(token=x_modelscope_token)
-        result = service.list_mcp_servers(
-            filter_criteria=request.filter,
-            total_count=request.total_count or 20,
-            search=request.search,
-        )
-        return ListServersResponse(**result)
-
-    except MCPAPIException as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": type(e).__name__,
-                "message": e.message,
-                "detail": e.detail,
-            },
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalError",
-                "message": "An unexpected error occurred",
-                "detail": str(e),
-            },
-        )
+    service = get_service(token=x_modelscope_token)
+    result = await service.list_mcp_servers(
+        filter_criteria=request.filter,
+        total_count=request.total_count or 20,
+        search=request.search,
+    )
+    return _json_response(ListServersResponse, result)
 
 
 @router.post(
@@ -107,40 +101,11 @@ async def list_operational_servers(
     x_modelscope_token: str = Header(
         ..., description="ModelScope API token (required)"
     ),
-) -> ListOperationalServersResponse:
+) -> Response:
     """List operational MCP servers (requires authentication)."""
-    try:
-        service = get_service(token=x_modelscope_token)
-        result = service.list_operational_mcp_servers()
-        return ListOperationalServersResponse(**result)
-
-    except AuthenticationError as e:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={
-                "error": "AuthenticationError",
-                "message": e.message,
-                "detail": e.detail,
-            },
-        )
-    except MCPAPIException as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": type(e).__name__,
-                "message": e.message,
-                "detail": e.detail,
-            },
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalError",
-                "message": "An unexpected error occurred",
-                "detail": str(e),
-            },
-        )
+    service = get_service(token=x_modelscope_token)
+    result = await service.list_operational_mcp_servers()
+    return _json_response(ListOperationalServersResponse, result)
 
 
 @router.post(
@@ -173,42 +138,8 @@ async def get_server(
     x_modelscope_token: Optional[str] = Header(
         None, description="ModelScope API token"
     ),
-) -> GetServerResponse:
+) -> Response:
     """Get detailed information about a specific MCP server."""
-    try:
-        # Ensure server_id has the @ prefix
-        server_id = request.server_id
-        if not server_id.startswith("@"):
-            server_id = f"@{server_id}"
-
-        service = get_service(token=x_modelscope_token)
-        result = service.get_mcp_server(server_id=server_id)
-        return GetServerResponse(**result)
-
-    except ServerNotFoundError as e:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error": "ServerNotFound",
-                "message": e.message,
-                "detail": e.detail,
-            },
-        )
-    except MCPAPIException as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": type(e).__name__,
-                "message": e.message,
-                "detail": e.detail,
-            },
-        )
-    except Exception as e:
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error": "InternalError",
-                "message": "An unexpected error occurred",
-                "detail": str(e),
-            },
-        )
+    service = get_service(token=x_modelscope_token)
+    result = await service.get_mcp_server(server_id=request.server_id)
+    return _json_response(GetServerResponse, result)
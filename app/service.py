@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import re
+import threading
 from typing import Any, Dict, Optional
 
 from modelscope.hub.mcp_api import MCPApi
@@ -18,6 +21,19 @@ from app.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Patterns used to classify SDK errors by their message
+_NOT_FOUND_RE = re.compile(r"not found|does not exist", re.IGNORECASE)
+_NETWORK_RE = re.compile(r"network|connection", re.IGNORECASE)
+_AUTH_RE = re.compile(r"auth|permission", re.IGNORECASE)
+
+# Retry policy shared by all service calls: only network errors are retried
+_network_retry = retry(
+    stop=stop_after_attempt(3),
+    wait=wait_exponential(multiplier=1, min=2, max=10),
+    retry=retry_if_exception_type(NetworkError),
+    reraise=True,
+)
+
 
 class MCPService:
     """Service class for ModelScope MCP operations with error handling and retry logic."""
@@ -31,30 +47,36 @@ class MCPService:
         """
         self.token = token
         self._api: Optional[MCPApi] = None
+        self._api_lock = threading.Lock()
 
     @property
     def api(self) -> MCPApi:
         """Lazy initialization of MCPApi instance."""
         if self._api is None:
-            self._api = MCPApi()
-            if self.token:
-                try:
-                    self._api.login(self.token)
-                    logger.info("Successfully authenticated with ModelScope")
-                except Exception as e:
-                    logger.error(f"Authentication failed: {str(e)}")
-                    raise AuthenticationError(
-                        "Failed to authenticate with ModelScope", detail=str(e)
-                    )
+            # Calls run in worker threads, so serialize the first login to
+            # authenticate once per token and avoid racing on the SDK's
+            # process-wide credential files.
+            with self._api_lock:
+                if self._api is None:
+                    api = MCPApi()
+                    if self.token:
+                        try:
+                            api.login(self.token)
+                            logger.info("Successfully authenticated with ModelScope")
+                        except Exception as e:
+                            logger.error("Authentication failed: %s", e)
+                            raise AuthenticationError(
+                                "Failed to authenticate with ModelScope",
+                                detail=str(e),
+                            )
+                    # Only keep the client once login succeeded, so a failed
+                    # login is retried instead of silently reusing an
+                    # unauthenticated client.
+                    self._api = api
         return self._api
 
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(NetworkError),
-        reraise=True,
-    )
-    def list_mcp_servers(
+    @_network_retry
+    async def list_mcp_servers(
         self,
         filter_criteria: Optional[Dict[str, Any]] = None,
         total_count: int = 20,
@@ -78,33 +100,37 @@ class MCPService:
         """
         try:
             logger.info(
-                f"Listing MCP servers: filter={filter_criteria}, "
-                f"count={total_count}, search={search}"
+                "Listing MCP servers: filter=%s, count=%s, search=%s",
+                filter_criteria,
+                total_count,
+                search,
             )
 
-            kwargs: Dict[str, Any] = {"total_count": total_count}
+            kwargs: Dict[str, Any] = {"token": self.token, "total_count": total_count}
             if filter_criteria:
                 kwargs["filter"] = filter_criteria
             if search:
                 kwargs["search"] = search
 
-            result = self.api.list_mcp_servers(**kwargs)
-            logger.info(f"Found {result.get('total_count', 0)} MCP servers")
+            # Resolve self.api inside the worker thread too, since the first
+            # access logs in with a blocking request.
+            result = await asyncio.to_thread(
+                lambda: self.api.list_mcp_servers(**kwargs)
+            )
+            logger.info("Found %s MCP servers", result.get("total_count", 0))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list MCP servers: {str(e)}")
-            if "network" in str(e).lower() or "connection" in str(e).lower():
-                raise NetworkError("Network error while listing servers", detail=str(e))
-            raise MCPAPIException("Failed to list MCP servers", detail=str(e))
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(NetworkError),
-        reraise=True,
-    )
-    def list_operational_mcp_servers(self) -> Dict[str, Any]:
+            error_msg = str(e)
+            logger.error("Failed to list MCP servers: %s", error_msg)
+            if _NETWORK_RE.search(error_msg):
+                raise NetworkError(
+                    "Network error while listing servers", detail=error_msg
+                )
+            raise MCPAPIException("Failed to list MCP servers", detail=error_msg)
+
+    @_network_retry
+    async def list_operational_mcp_servers(self) -> Dict[str, Any]:
         """
         List operational (activated) MCP servers.
 
@@ -124,27 +150,28 @@ class MCPService:
 
         try:
             logger.info("Listing operational MCP servers")
-            result = self.api.list_operational_mcp_servers()
-            logger.info(f"Found {result.get('total_count', 0)} operational servers")
+            result = await asyncio.to_thread(
+                lambda: self.api.list_operational_mcp_servers(token=self.token)
+            )
+            logger.info("Found %s operational servers", result.get("total_count", 0))
             return result
 
         except Exception as e:
-            logger.error(f"Failed to list operational servers: {str(e)}")
-            if "auth" in str(e).lower() or "permission" in str(e).lower():
-                raise AuthenticationError("Authentication failed", detail=str(e))
-            if "network" in str(e).lower() or "connection" in str(e).lower():
+            error_msg = str(e)
+            logger.error("Failed to list operational servers: %s", error_msg)
+            if _AUTH_RE.search(error_msg):
+                raise AuthenticationError("Authentication failed", detail=error_msg)
+            if _NETWORK_RE.search(error_msg):
                 raise NetworkError(
-                    "Network error while listing operational servers", detail=str(e)
+                    "Network error while listing operational servers",
+                    detail=error_msg,
                 )
-            raise MCPAPIException("Failed to list operational servers", detail=str(e))
-
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        retry=retry_if_exception_type(NetworkError),
-        reraise=True,
-    )
-    def get_mcp_server(self, server_id: str) -> Dict[str, Any]:
+            raise MCPAPIException(
+                "Failed to list operational servers", detail=error_msg
+            )
+
+    @_network_retry
+    async def get_mcp_server(self, server_id: str) -> Dict[str, Any]:
         """
         Get detailed information about a specific MCP server.
 
@@ -160,23 +187,26 @@ class MCPService:
             MCPAPIException: For other API errors
         """
         try:
-            logger.info(f"Getting MCP server details: {server_id}")
-            result = self.api.get_mcp_server(server_id=server_id)
-            logger.info(f"Successfully retrieved server: {server_id}")
+            logger.info("Getting MCP server details: %s", server_id)
+            result = await asyncio.to_thread(
+                lambda: self.api.get_mcp_server(server_id=server_id, token=self.token)
+            )
+            logger.info("Successfully retrieved server: %s", server_id)
             return result
 
         except Exception as e:
-            error_msg = str(e).lower()
-            logger.error(f"Failed to get MCP server {server_id}: {str(e)}")
+            error_msg = str(e)
+            logger.error("Failed to get MCP server %s: %s", server_id, error_msg)
 
-            if "not found" in error_msg or "does not exist" in error_msg:
+            if _NOT_FOUND_RE.search(error_msg):
                 raise ServerNotFoundError(
-                    f"MCP server '{server_id}' not found", detail=str(e)
+                    f"MCP server '{server_id}' not found", detail=error_msg
                 )
-            if "network" in error_msg or "connection" in error_msg:
+            if _NETWORK_RE.search(error_msg):
                 raise NetworkError(
-                    f"Network error while getting server {server_id}", detail=str(e)
+                    f"Network error while getting server {server_id}",
+                    detail=error_msg,
                 )
             raise MCPAPIException(
-                f"Failed to get MCP server '{server_id}'", detail=str(e)
+                f"Failed to get MCP server '{server_id}'", detail=error_msg
             )
@@ -1,4 +1,5 @@
 import logging
+import os
 import sys
 import time
 from contextlib import asynccontextmanager
@@ -7,10 +8,16 @@ from fastapi import FastAPI, Request, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.config import get_settings
-from app.exceptions import MCPAPIException
+from app.exceptions import (
+    AuthenticationError,
+    MCPAPIException,
+    NetworkError,
+    ServerNotFoundError,
+)
 from app.models import HealthResponse
 from app.routes import router
 
@@ -38,6 +45,7 @@ async def lifespan(app: FastAPI):
 # Create FastAPI application
 app = FastAPI(
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs",
     redoc_url="/redoc",
     openapi_url="/openapi.json",
@@ -52,58 +60,100 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Add GZip middleware for response compression
-app.add_middleware(GZipMiddleware, minimum_size=1000)
-
 
 # Request logging middleware
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
+class TimingLogMiddleware:
     """Log all incoming requests and their processing time."""
-    start_time = time.time()
 
-    # Log request
-    logger.info(f"Request: {request.method} {request.url.path}")
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-    # Process request
-    response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-    # Calculate processing time
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
+        start_ns = time.perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        log_enabled = logger.isEnabledFor(logging.INFO)
 
-    # Log response
-    logger.info(
-        f"Response: {request.method} {request.url.path} "
-        f"- Status: {response.status_code} - Time: {process_time:.3f}s"
-    )
+        # Log request
+        if log_enabled:
+            logger.info("Request: %s %s", method, path)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Calculate processing time
+                process_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+                headers = list(message.get("headers", []))
+                headers.append((b"x-process-time", f"{process_ms:.3f}".encode()))
+                message["headers"] = headers
+
+                # Log response
+                if log_enabled:
+                    logger.info(
+                        "Response: %s %s - Status: %s - Time: %.3fms",
+                        method,
+                        path,
+                        message["status"],
+                        process_ms,
+                    )
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app.add_middleware(TimingLogMiddleware)
 
-    return response
+# Add GZip middleware for response compression. Registered after the timing
+# middleware so it wraps it and compression is not counted in X-Process-Time.
+app.add_middleware(GZipMiddleware, minimum_size=2048, compresslevel=5)
 
 
 # Exception handlers
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     """Handle request validation errors."""
-    logger.warning(f"Validation error: {exc.errors()}")
+    errors = exc.errors()
+    logger.warning("Validation error: %s", errors)
+    # Errors echo the raw client input, which orjson cannot always encode
+    # (e.g. integers beyond 64 bits), so use the stdlib encoder here
     return JSONResponse(
         status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         content={
             "error": "RequestValidationError",
             "message": "Request validation failed",
-            "detail": exc.errors(),
+            "detail": errors,
         },
     )
 
 
+# Status code and error name for each MCP API exception, unknown subclasses
+# fall back to 500 with their class name
+MCP_ERROR_TEMPLATES: dict[type[MCPAPIException], tuple[int, str]] = {
+    AuthenticationError: (status.HTTP_401_UNAUTHORIZED, "AuthenticationError"),
+    ServerNotFoundError: (status.HTTP_404_NOT_FOUND, "ServerNotFound"),
+    NetworkError: (status.HTTP_500_INTERNAL_SERVER_ERROR, "NetworkError"),
+    MCPAPIException: (status.HTTP_500_INTERNAL_SERVER_ERROR, "MCPAPIException"),
+}
+
+# Only expose unexpected exception messages to clients when debugging
+EXPOSE_ERROR_DETAIL = settings.log_level == "DEBUG"
+
+
 @app.exception_handler(MCPAPIException)
 async def mcp_exception_handler(request: Request, exc: MCPAPIException):
     """Handle MCP API exceptions."""
-    logger.error(f"MCP API error: {exc.message}")
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    logger.error("MCP API error: %s", exc.message)
+    status_code, error = MCP_ERROR_TEMPLATES.get(type(exc)) or (
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        type(exc).__name__,
+    )
+    return ORJSONResponse(
+        status_code=status_code,
         content={
-            "error": type(exc).__name__,
+            "error": error,
             "message": exc.message,
             "detail": exc.detail,
         },
@@ -113,13 +163,13 @@ async def mcp_exception_handler(request: Request, exc: MCPAPIException):
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle all other exceptions."""
-    logger.error(f"Unhandled exception: {str(exc)}", exc_info=True)
-    return JSONResponse(
+    logger.error("Unhandled exception: %s", exc, exc_info=True)
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content={
             "error": "InternalServerError",
             "message": "An unexpected error occurred",
-            "detail": str(exc) if settings.log_level == "DEBUG" else None,
+            "detail": str(exc) if EXPOSE_ERROR_DETAIL else None,
         },
     )
 
@@ -164,6 +214,10 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=False,
+        workers=settings.workers or os.process_cpu_count() or 1,
+        loop="uvloop",
+        http="httptools",
+        proxy_headers=True,
+        server_header=False,
         log_level=settings.log_level.lower(),
     )
@@ -0,0 +1,19 @@
+from fastapi.testclient import TestClient
+
+from main import app
+
+client = TestClient(app, raise_server_exceptions=False)
+
+
+def test_validation_error_with_oversized_int_returns_422():
+    """Validation errors echoing huge client integers must still encode."""
+    oversized = 10**30
+
+    for path, body in [
+        ("/api/v1/servers/list", {"total_count": oversized}),
+        ("/api/v1/servers/detail", {"server_id": oversized}),
+    ]:
+        response = client.post(path, json=body)
+
+        assert response.status_code == 422
+        assert response.json()["error"] == "RequestValidationError"
@@ -0,0 +1,36 @@
+import asyncio
+import threading
+import time
+
+from app import service as service_module
+from app.service import MCPService
+
+
+class FakeMCPApi:
+    """Stand-in for MCPApi that counts logins."""
+
+    login_count = 0
+    _count_lock = threading.Lock()
+
+    def login(self, token):
+        time.sleep(0.05)
+        with self._count_lock:
+            FakeMCPApi.login_count += 1
+
+    def list_mcp_servers(self, **kwargs):
+        return {"total_count": 0, "servers": []}
+
+
+def test_concurrent_first_requests_login_once(monkeypatch):
+    """Concurrent first calls on a new service share a single login."""
+    monkeypatch.setattr(service_module, "MCPApi", FakeMCPApi)
+    monkeypatch.setattr(FakeMCPApi, "login_count", 0)
+    service = MCPService(token="token")
+
+    async def run_concurrently():
+        return await asyncio.gather(*(service.list_mcp_servers() for _ in range(8)))
+
+    results = asyncio.run(run_concurrently())
+
+    assert len(results) == 8
+    assert FakeMCPApi.login_count == 1